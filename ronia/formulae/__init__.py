@@ -1 +1,12 @@
-from .bayespy import *
+"""Formula types and constructors
+
+.. autosummary::
+   :toctree: _autosummary
+
+   bayespy
+   formula
+
+"""
+
+from . import bayespy
+from .formula import *
@@ -1,28 +1,229 @@
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import weakref
+
 import attr
 import bayespy as bp
 import numpy as np
-import scipy as sp
 from scipy import interpolate
 
 from ronia import utils
-from ronia.utils import listmap, rlift_basis
+from ronia.utils import concat_gaussians, listmap, rlift_basis
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Allow running without Numba; the NumPy fallbacks below are used
+    njit = None
+
+
+@attr.s(frozen=True)
+class BatchedBasis():
+    """Basis evaluated one design-matrix block at a time
+
+    Looks like a list of basis functions (length, iteration, indexing) but
+    evaluates all of its columns with a single call so that
+    :func:`design_matrix` skips the per-function Python dispatch.
+
+    Parameters
+    ----------
+    evaluate : Callable
+        Maps input data to the full ``(N, K)`` design-matrix block
+    functions : list
+        Per-column basis functions, used where individual functions are
+        needed (e.g. term algebra and flattening)
+
+    """
+
+    evaluate = attr.ib()
+    functions = attr.ib()
+
+    def __call__(self, input_data, out=None):
+        X = self.evaluate(input_data)
+        if out is None:
+            return X
+        out[...] = X
+        return out
+
+    def __len__(self):
+        return len(self.functions)
 
+    def __iter__(self):
+        return iter(self.functions)
 
-def concat_gaussians(gaussians: list):
-    # gaussians = [(μ1, Λ1), (μ2, Λ2)]
-    return (
-        np.hstack([g[0] for g in gaussians]),
-        sp.linalg.block_diag(*[g[1] for g in gaussians])
+    def __getitem__(self, index):
+        return self.functions[index]
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+
+# Input size from which independent per-term design builds are worth
+# spreading over threads; NumPy releases the GIL in the heavy kernels
+_PARALLEL_MIN_ROWS = 4096
+
+
+# Design matrices memoized on (formula, input data contents). Safe
+# because formulae are frozen; the weak reference guards against a
+# recycled id() pointing at a different formula
+_design_cache = collections.OrderedDict()
+_DESIGN_CACHE_SIZE = 16
+
+
+def design_matrix(input_data, basis, out=None, dtype=np.float64):
+    # Single precision halves the memory traffic of large basis
+    # matrices; the basis functions themselves still evaluate in double
+    if isinstance(basis, BatchedBasis):
+        X = basis(input_data, out=out)
+        return X if X.dtype == dtype else X.astype(dtype)
+    # Fill a preallocated column-major matrix in place instead of
+    # hstack-concatenating one reshaped column per basis function
+    X = (
+        np.empty((len(input_data), len(basis)), dtype=dtype, order="F")
+        if out is None else out
     )
+    for (j, f) in enumerate(basis):
+        X[:, j] = np.reshape(f(input_data), -1)
+    return X
 
 
-def design_matrix(input_data, basis):
-    return np.hstack([
-        f(input_data).reshape(-1, 1) for f in basis
-    ])
+def compile_design_matrix(bases):
+    """Generate a design-matrix builder specialized to a formula shape
+
+    Unrolls the per-term and per-function fill loops of
+    :func:`design_matrix` into straight-line code with the basis
+    functions bound as locals, removing the loop and dispatch overhead
+    from the hot path. Batched terms compile to a single block
+    assignment. Returns a callable ``(input_data, dtype) -> X``.
+
+    """
+    namespace = {"np": np}
+    lines = []
+    offset = 0
+    for (i, basis) in enumerate(bases):
+        size = len(basis)
+        if isinstance(basis, BatchedBasis):
+            name = "b{0}".format(i)
+            namespace[name] = basis
+            lines.append(
+                "    {0}(t, out=X[:, {1}:{2}])".format(
+                    name, offset, offset + size
+                )
+            )
+        else:
+            for (j, f) in enumerate(basis):
+                name = "f{0}_{1}".format(i, j)
+                namespace[name] = f
+                lines.append(
+                    "    X[:, {0}] = np.reshape({1}(t), -1)".format(
+                        offset + j, name
+                    )
+                )
+        offset += size
+    exec(
+        "def fill(t, X):\n{0}\n    return X\n".format(
+            "\n".join(lines) if lines else "    pass"
+        ),
+        namespace
+    )
+    fill = namespace["fill"]
+    n_columns = offset
+
+    def build(input_data, dtype=np.float64):
+        return fill(
+            input_data,
+            np.empty((len(input_data), n_columns), dtype=dtype, order="F")
+        )
+
+    return build
 
 
 @attr.s(frozen=True)
+class KronPrior():
+    """Implicit Kronecker product of two Gaussian priors
+
+    Behaves like the pair ``(kron(mu_a, mu_b), kron(Lambda_a, Lambda_b))``
+    but stores only the factors. The dense ``(mn)×(mn)`` precision matrix
+    is materialized (and cached) first when asked for, e.g. by
+    :func:`BayesPyFormula.build_theta`. Linear algebra that does not need
+    the dense matrix should use :func:`matvec` and :func:`cholesky`, which
+    operate on the small factors only.
+
+    Parameters
+    ----------
+    mu_a : np.ndarray
+        Prior mean of the left factor
+    mu_b : np.ndarray
+        Prior mean of the right factor
+    Lambda_a : np.ndarray
+        Prior precision of the left factor
+    Lambda_b : np.ndarray
+        Prior precision of the right factor
+
+    """
+
+    mu_a = attr.ib(converter=np.atleast_1d)
+    mu_b = attr.ib(converter=np.atleast_1d)
+    Lambda_a = attr.ib(converter=np.atleast_2d)
+    Lambda_b = attr.ib(converter=np.atleast_2d)
+
+    @functools.cached_property
+    def is_zero_mean(self):
+        # The typical case: Kron bases correspond to zero-mean r.v.'s
+        return not (np.any(self.mu_a) and np.any(self.mu_b))
+
+    @property
+    def mean(self):
+        return (
+            np.zeros(len(self.mu_a) * len(self.mu_b))
+            if self.is_zero_mean
+            else np.kron(self.mu_a, self.mu_b)
+        )
+
+    @functools.cached_property
+    def precision(self):
+        # NOTE: Cached because BayesPy needs the full matrix. Everything
+        #       else here works on the factors.
+        return np.kron(self.Lambda_a, self.Lambda_b)
+
+    def matvec(self, v):
+        """Product of the precision matrix with a vector
+
+        Uses the mixed-product identity ``(A ⊗ B) vec(V) = vec(A V Bᵀ)``
+        (row-major vectorization), turning one O(m²n²) matvec into two
+        small matrix products of size O(m²n + mn²).
+
+        """
+        V = np.reshape(v, (len(self.mu_a), len(self.mu_b)))
+        return (self.Lambda_a @ V @ self.Lambda_b.T).ravel()
+
+    def cholesky(self):
+        """Cholesky factors of the precision matrix
+
+        ``chol(A ⊗ B) = chol(A) ⊗ chol(B)``, so the factored pair fully
+        represents the Cholesky decomposition of the Kronecker product.
+
+        """
+        return (
+            np.linalg.cholesky(self.Lambda_a),
+            np.linalg.cholesky(self.Lambda_b)
+        )
+
+    def __getitem__(self, index):
+        # Quacks like the usual (mean, precision) tuple; one index
+        # materializes only the asked-for array
+        return self.mean if index == 0 else self.precision
+
+
+# Slotted to drop the per-instance __dict__: formula algebra creates
+# many short-lived intermediate instances. The weakref slot is needed by
+# the design-matrix memo.
+@attr.s(frozen=True, slots=True, weakref_slot=True)
 class BayesPyFormula():
     """BayesianGAM model configuration settings
 
@@ -56,12 +257,23 @@ class BayesPyFormula():
 
     def __mul__(self, input_map):
         # What other linear operations should be supported?
-        return BayesPyFormula(
-            bases=[
-                listmap(
+
+        def multiply(basis):
+            # Evaluate the input map once per term and scale the rows of
+            # the whole design block, instead of re-evaluating it inside
+            # one closure per basis function
+            return BatchedBasis(
+                evaluate=lambda t: (
+                    design_matrix(t, basis) *
+                    np.reshape(input_map(t), (-1, 1))
+                ),
+                functions=listmap(
                     lambda f: lambda t: f(t) * input_map(t)
-                )(basis) for basis in self.bases
-            ],
+                )(basis)
+            )
+
+        return BayesPyFormula(
+            bases=[multiply(basis) for basis in self.bases],
             prior=self.prior
         )
 
@@ -80,16 +292,98 @@ class BayesPyFormula():
     def build_theta(self):
         return bp.nodes.Gaussian(self.prior[0], self.prior[1])
 
-    def build_Xi(self, input_data, i):
-        return design_matrix(input_data, self.bases[i])
+    def build_nodes(self, input_data, dtype=np.float64):
+        """Build the weight and dot-product nodes in one call
 
-    def build_Xs(self, input_data):
-        return [
-            self.build_Xi(input_data, i) for i, _ in enumerate(self.bases)
-        ]
+        Returns the pair ``(theta, F)`` where ``F = SumMultiply("i,i",
+        theta, X)`` is the additive model prediction node. The design
+        matrix goes through the :func:`build_X` memo, so building nodes
+        repeatedly on the same input data reuses the same ``X``.
+
+        NOTE: The nodes themselves are deliberately not cached: BayesPy
+        mutates them in place during inference, so sharing them between
+        fits would leak state.
 
-    def build_X(self, input_data):
-        return np.hstack(self.build_Xs(input_data))
+        """
+        theta = self.build_theta()
+        return (
+            theta,
+            bp.nodes.SumMultiply("i,i", theta, self.build_X(input_data, dtype))
+        )
+
+    def compile_X(self):
+        """Compile a design-matrix builder specialized to this formula
+
+        Worthwhile when the same formula is evaluated against many input
+        batches, e.g. inside sampling or prediction loops.
+
+        """
+        return compile_design_matrix(self.bases)
+
+    def build_Xi(self, input_data, i, dtype=np.float64):
+        return design_matrix(input_data, self.bases[i], dtype=dtype)
+
+    def build_Xs(self, input_data, dtype=np.float64):
+        indices = range(len(self.bases))
+        if len(self.bases) > 1 and len(input_data) >= _PARALLEL_MIN_ROWS:
+            # Terms are independent, so build them concurrently
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                return list(
+                    executor.map(
+                        lambda i: self.build_Xi(input_data, i, dtype=dtype),
+                        indices
+                    )
+                )
+        return [self.build_Xi(input_data, i, dtype=dtype) for i in indices]
+
+    def build_X(self, input_data, dtype=np.float64):
+        """Build the full design matrix
+
+        Repeated calls with equal input data return a cached matrix, so
+        the result must not be mutated in place. With large bases,
+        ``dtype=np.float32`` halves the memory footprint at the cost of
+        single precision.
+
+        """
+        input_data = np.asarray(input_data)
+        key = (
+            id(self), input_data.shape,
+            hashlib.blake2b(input_data.tobytes()).digest(),
+            np.dtype(dtype).str
+        )
+        cached = _design_cache.get(key)
+        if cached is not None and cached[0]() is self:
+            _design_cache.move_to_end(key)
+            return cached[1]
+        # One preallocated matrix, each term filling its own column range
+        sizes = [len(basis) for basis in self.bases]
+        X = np.empty(
+            (len(input_data), sum(sizes)), dtype=dtype, order="F"
+        )
+        blocks = []
+        j = 0
+        for (basis, size) in zip(self.bases, sizes):
+            blocks.append((basis, X[:, j:j + size]))
+            j += size
+        if len(blocks) > 1 and len(input_data) >= _PARALLEL_MIN_ROWS:
+            # Disjoint column ranges, so the terms can fill concurrently
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                collections.deque(
+                    executor.map(
+                        lambda block: design_matrix(
+                            input_data, block[0], out=block[1], dtype=dtype
+                        ),
+                        blocks
+                    ),
+                    maxlen=0
+                )
+        else:
+            for (basis, out) in blocks:
+                design_matrix(input_data, basis, out=out, dtype=dtype)
+        _design_cache[key] = (weakref.ref(self), X)
+        if len(_design_cache) > _DESIGN_CACHE_SIZE:
+            _design_cache.popitem(last=False)
+        return X
 
 
 #
@@ -146,22 +440,34 @@ def Kron(a, b):
     #       corresponds to the product r.v. of independent r.v.'s.
     #       Check the formula of variance of product of independent r.v.'s.
 
-    # In the same order as in a Kronecker product
-    gen = (
-        (f, g) for g in utils.flatten(b.bases) for f in utils.flatten(a.bases)
+    basis_a = a.bases[0] if len(a.bases) == 1 else utils.flatten(a.bases)
+    basis_b = b.bases[0] if len(b.bases) == 1 else utils.flatten(b.bases)
+
+    def evaluate(t):
+        # Row-wise Kronecker (Khatri-Rao) product of the factor design
+        # blocks, one broadcast instead of len(a)·len(b) Python calls
+        Xa = design_matrix(t, basis_a)
+        Xb = design_matrix(t, basis_b)
+        return (Xb[:, :, None] * Xa[:, None, :]).reshape(Xa.shape[0], -1)
+
+    # Outer product of bases, in the same order as in a Kronecker product
+    basis = BatchedBasis(
+        evaluate=evaluate,
+        functions=[
+            (lambda f_, g_: lambda t: f_(t) * g_(t))(f, g)
+            for g in basis_b for f in basis_a
+        ]
     )
 
-    # Outer product of bases
-    basis = listmap(
-        lambda funcs: lambda t: funcs[0](t) * funcs[1](t)
-    )(gen)
-
-    # Kronecker product of prior means and covariances
+    # Kronecker product of prior means and covariances, kept in factored
+    # form and materialized only on demand
     return BayesPyFormula(
         bases=[basis],
-        prior=(
-            np.kron(a.prior[0], b.prior[0]),
-            np.kron(a.prior[1], b.prior[1])
+        prior=KronPrior(
+            mu_a=a.prior[0],
+            mu_b=b.prior[0],
+            Lambda_a=a.prior[1],
+            Lambda_b=b.prior[1]
         )
     )
 
@@ -171,11 +477,97 @@ def Kron(a, b):
 #
 
 
+@functools.lru_cache(maxsize=32)
+def _exp_squared_svd(grid_bytes, corrlen):
+    # Cached on the grid contents so that tuning loops varying only sigma
+    # or the regularization skip the O(N³) decomposition
+    grid = np.frombuffer(grid_bytes).reshape(-1, 1)
+    (U, S, _) = np.linalg.svd(
+        utils.exp_squared(
+            x1=grid,
+            x2=grid,
+            corrlen=corrlen,
+            sigma=1.0
+        )
+    )
+    return (U, S)
+
+
+@functools.lru_cache(maxsize=32)
+def _exp_sine_squared_svd(grid_bytes, corrlen, period):
+    grid = np.frombuffer(grid_bytes).reshape(-1, 1)
+    (U, S, _) = np.linalg.svd(
+        utils.exp_sine_squared(
+            x1=grid,
+            x2=grid,
+            corrlen=corrlen,
+            sigma=1.0,
+            period=period
+        )
+    )
+    return (U, S)
+
+
+@functools.lru_cache(maxsize=32)
+def _exp_squared_nystrom(grid_bytes, corrlen, n_inducing):
+    # Nyström approximation with evenly spaced inducing points: only the
+    # N × m and m × m kernel blocks are formed and the decomposition is
+    # O(m³) instead of O(N³)
+    grid = np.frombuffer(grid_bytes).reshape(-1, 1)
+    inducing = grid[
+        np.linspace(0, len(grid) - 1, n_inducing).astype(int)
+    ]
+    K_nm = utils.exp_squared(
+        x1=grid,
+        x2=inducing,
+        corrlen=corrlen,
+        sigma=1.0
+    )
+    K_mm = utils.exp_squared(
+        x1=inducing,
+        x2=inducing,
+        corrlen=corrlen,
+        sigma=1.0
+    )
+    (U, S, _) = np.linalg.svd(K_mm)
+    # Scaled approximate principal vectors: B @ B.T ≈ K_nm K_mm⁻¹ K_nmᵀ
+    return (K_nm @ (U / np.sqrt(S)), S)
+
+
+def _interp_basis(vectors, grid):
+    # One packed interpolator for the batched path, per-column
+    # interpolators as the fallback functions
+    return BatchedBasis(
+        evaluate=utils.interp1d_packed(
+            vectors, grid=grid, fill_value="extrapolate"
+        ),
+        functions=utils.interp_arrays1d(
+            vectors, grid=grid, fill_value="extrapolate"
+        )
+    )
+
+
+def _scaled_principal_vectors(U, S, sigma, energy):
+    # Sigma multiplies the kernel, hence the singular values, linearly.
+    # Rescaling and truncating the cached decomposition reproduces
+    # utils.decompose_covariance(sigma * K, energy) in O(N²)
+    crop = (S.cumsum() / S.sum()) <= energy
+    return np.dot(U[:, crop], np.sqrt(np.diag(sigma * S[crop])))
+
+
 def ExpSquared1d(
-    grid, corrlen, sigma, prior=None, mu_basis=None, mu_hyper=None, energy=0.99
+    grid, corrlen, sigma, prior=None, mu_basis=None, mu_hyper=None,
+    energy=0.99, n_inducing=None
 ):
     """Squared exponential model term
 
+    Parameters
+    ----------
+    n_inducing : int
+        Number of evenly spaced inducing points for the Nyström
+        approximation of the kernel decomposition. Default is the exact
+        decomposition using the full ``len(grid)²`` kernel matrix.
+
     Example
     -------
 
@@ -191,26 +583,22 @@ def ExpSquared1d(
 
     """
     mu_basis = [] if mu_basis is None else mu_basis
-    basis = utils.interp1d_1darrays(
-        utils.scaled_principal_eigvecsh(
-            utils.exp_squared(
-                X1=grid.reshape(-1, 1),
-                X2=grid.reshape(-1, 1),
-                corrlen=corrlen,
-                sigma=sigma
-            ),
-            energy=energy
-        ),
-        grid=grid,
-        fill_value="extrapolate"
-    )
+    grid = np.ascontiguousarray(grid, dtype=np.float64)
+    if n_inducing is None:
+        (U, S) = _exp_squared_svd(grid.tobytes(), corrlen)
+        vectors = _scaled_principal_vectors(U, S, sigma, energy)
+    else:
+        (B, S) = _exp_squared_nystrom(grid.tobytes(), corrlen, n_inducing)
+        crop = (S.cumsum() / S.sum()) <= energy
+        vectors = np.sqrt(sigma) * B[:, crop]
+    basis = _interp_basis(vectors, grid)
     # Default prior is white noise
     prior = (
-        (np.zeros(len(basis)), np.identity(len(basis)))
+        utils.IsotropicPrior(len(basis))
         if prior is None else prior
     )
     return BayesPyFormula(
-        bases=[mu_basis + basis],
+        bases=[mu_basis + basis if mu_basis else basis],
         prior=prior if mu_hyper is None else concat_gaussians(
             [mu_hyper, prior]
         )
@@ -222,27 +610,16 @@ def ExpSineSquared1d(
     prior=None, mu_basis=None, mu_hyper=None, energy=0.99
 ):
     mu_basis = [] if mu_basis is None else mu_basis
-    basis = utils.interp1d_1darrays(
-        utils.scaled_principal_eigvecsh(
-            utils.exp_sine_squared(
-                X1=grid.reshape(-1, 1),
-                X2=grid.reshape(-1, 1),
-                corrlen=corrlen,
-                sigma=sigma,
-                period=period
-            ),
-            energy=energy
-        ),
-        grid=grid,
-        fill_value="extrapolate"
-    )
+    grid = np.ascontiguousarray(grid, dtype=np.float64)
+    (U, S) = _exp_sine_squared_svd(grid.tobytes(), corrlen, period)
+    basis = _interp_basis(_scaled_principal_vectors(U, S, sigma, energy), grid)
     # Default prior is white noise
     prior = (
-        (np.zeros(len(basis)), np.identity(len(basis)))
+        utils.IsotropicPrior(len(basis))
         if prior is None else prior
     )
     return BayesPyFormula(
-        bases=[mu_basis + basis],
+        bases=[mu_basis + basis if mu_basis else basis],
         prior=prior if mu_hyper is None else concat_gaussians(
             [mu_hyper, prior]
         )
@@ -253,21 +630,20 @@ def WhiteNoise1d(
     grid, sigma, prior=None, mu_basis=None, mu_hyper=None, energy=1.0
 ):
     mu_basis = [] if mu_basis is None else mu_basis
-    basis = utils.interp1d_1darrays(
-        utils.scaled_principal_eigvecsh(
+    basis = _interp_basis(
+        utils.decompose_covariance(
             utils.white_noise(n_dims=len(grid), sigma=sigma),
             energy=energy
         ),
-        grid=grid,
-        fill_value="extrapolate"
+        grid
     )
     # Default prior is white noise
     prior = (
-        (np.zeros(len(basis)), np.identity(len(basis)))
+        utils.IsotropicPrior(len(basis))
         if prior is None else prior
     )
     return BayesPyFormula(
-        bases=[mu_basis + basis],
+        bases=[mu_basis + basis if mu_basis else basis],
         prior=prior if mu_hyper is None else concat_gaussians(
             [mu_hyper, prior]
         )
@@ -289,19 +665,56 @@ def Function(function, prior):
     return BayesPyFormula(bases=[basis], prior=prior)
 
 
+def _relu_design(t, knots, flipped):
+    # One broadcast over the full N × K design block instead of a Python
+    # loop per knot
+    T = t[:, None]
+    return ((T < knots) if flipped else (T > knots)) * (knots - T)
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _relu_design(t, knots, flipped):  # noqa: F811
+        out = np.empty((len(t), len(knots)))
+        for j in prange(len(knots)):
+            c = knots[j]
+            for i in range(len(t)):
+                below = t[i] < c
+                out[i, j] = (
+                    (c - t[i]) if below == flipped and t[i] != c else 0.0
+                )
+        return out
+
+
+def _relu_basis(grid, flipped):
+    knots = np.ascontiguousarray(grid[1:-1], dtype=np.float64)
+    return BatchedBasis(
+        evaluate=lambda t: _relu_design(
+            np.ravel(np.asarray(t, dtype=np.float64)), knots, flipped
+        ),
+        functions=listmap(
+            lambda c: (
+                (lambda t: (t < c) * (c - t)) if flipped else
+                (lambda t: (t > c) * (c - t))
+            )
+        )(knots)
+    )
+
+
 def ReLU(grid, prior=None):
-    relus = listmap(lambda c: lambda t: (t > c) * (c - t))(grid[1:-1])
+    relus = _relu_basis(grid, flipped=False)
     prior = (
-        (np.zeros(len(grid) - 2), np.identity(len(grid) - 2))
+        utils.IsotropicPrior(len(grid) - 2)
         if not prior else prior
     )
     return BayesPyFormula(bases=[relus], prior=prior)
 
 
 def FlippedReLU(grid, prior=None):
-    relus = listmap(lambda c: lambda t: (t < c) * (c - t))(grid[1:-1])
+    relus = _relu_basis(grid, flipped=True)
     prior = (
-        (np.zeros(len(grid) - 2), np.identity(len(grid) - 2))
+        utils.IsotropicPrior(len(grid) - 2)
         if not prior else prior
     )
     return BayesPyFormula(bases=[relus], prior=prior)
@@ -335,11 +748,26 @@ def BSpline1d(grid, order=3, extrapolate=True,
     #       (extrapolation + damping)
 
     mu_basis = [] if mu_basis is None else mu_basis
-    grid_ext = utils.extend_spline_grid(grid, order)
+    grid_ext = np.ascontiguousarray(
+        utils.extend_spline_grid(grid, order), dtype=np.float64
+    )
+    degree = order - 1
+    spline_args = list(
+        utils.gen_spline_args_from_grid_ext(grid_ext, order, extrapolate)
+    )
+
+    # SciPy spline objects are constructed once here instead of inside
+    # the per-call basis evaluation
+    elements = listmap(
+        lambda spline_arg: interpolate.BSpline.basis_element(
+            spline_arg[0],
+            spline_arg[1] if spline_arg[2] in (-1, 1) else False
+        )
+    )(spline_args)
 
-    def build_basis_element(spline_arg):
+    def build_basis_element(element, spline_arg):
 
-        (knots, extrapolate, loc) = spline_arg
+        (knots, _, loc) = spline_arg
 
         def right_damp(t):
             return t > knots[-1]
@@ -347,29 +775,60 @@ def BSpline1d(grid, order=3, extrapolate=True,
         def left_damp(t):
             return knots[0] > t
 
-        def element(t):
-            sp_element = interpolate.BSpline.basis_element(
-                knots,
-                extrapolate if loc in (-1, 1) else False
-            )
-            return sp_element(t) if loc == 0 else (
-                sp_element(t) * right_damp(t) if loc == -1 else
-                sp_element(t) * left_damp(t)
+        def evaluate(t):
+            return element(t) if loc == 0 else (
+                element(t) * right_damp(t) if loc == -1 else
+                element(t) * left_damp(t)
             )
 
-        return utils.compose2(np.nan_to_num, element)
+        return utils.compose2(np.nan_to_num, evaluate)
+
+    # Constants of the batched evaluation, resolved once here: the base
+    # interval of the extended knot vector and the damped, possibly
+    # extrapolating edge elements with their damping thresholds
+    (base_low, base_high) = (grid_ext[degree], grid_ext[-degree - 1])
+    edges = [
+        (j, element, loc, knots[-1] if loc == -1 else knots[0])
+        for (j, (element, (knots, _, loc)))
+        in enumerate(zip(elements, spline_args))
+        if loc != 0
+    ]
+
+    def evaluate_batch(t):
+        # Interior columns in one vectorized de Boor recursion; the few
+        # edge columns separately
+        t = np.ravel(np.asarray(t, dtype=np.float64))
+        X = np.zeros((len(t), len(elements)), dtype=np.float64, order="F")
+        inside = (t >= base_low) & (t <= base_high)
+        if inside.any():
+            X[inside, :] = interpolate.BSpline.design_matrix(
+                t[inside], grid_ext, degree
+            ).toarray()
+        # Interior elements vanish outside the base interval, so only
+        # the edge columns need a second pass
+        for (j, element, loc, bound) in edges:
+            X[:, j] = np.nan_to_num(element(t)) * (
+                (t > bound) if loc == -1 else (bound > t)
+            )
+        return X
 
-    basis = listmap(build_basis_element)(
-        utils.gen_spline_args_from_grid_ext(grid_ext, order, extrapolate)
+    basis = BatchedBasis(
+        evaluate=evaluate_batch,
+        functions=[
+            build_basis_element(element, spline_arg)
+            for (element, spline_arg) in zip(elements, spline_args)
+        ]
     )
 
     # Default prior is white noise
     prior = (
-        (np.zeros(len(basis)), np.identity(len(basis)))
+        utils.IsotropicPrior(len(basis))
         if prior is None else prior
     )
     return BayesPyFormula(
-        bases=[mu_basis + basis],
+        # NOTE: Prepending mean basis functions falls back to the
+        #       per-function list representation
+        bases=[mu_basis + basis if mu_basis else basis],
         prior=prior if mu_hyper is None else concat_gaussians(
             [mu_hyper, prior]
         )
@@ -95,7 +95,12 @@ class Formula:
     def design_matrix(self, input_data: np.ndarray, i: int=None):
         # If one term is asked for, give it. Otherwise use all terms.
         fs = sum(self.terms, []) if i is None else self.terms[i]
-        return np.hstack([f(input_data).reshape(-1, 1) for f in fs])
+        # Write each column into a preallocated matrix instead of
+        # hstack-concatenating one reshaped column per basis function
+        X = np.empty((len(input_data), len(fs)), dtype=np.float64, order="F")
+        for (j, f) in enumerate(fs):
+            X[:, j] = np.reshape(f(input_data), -1)
+        return X
 
 
 #
@@ -10,3 +10,6 @@
 
 from . import bayespy
 from . import numpy
+
+# Backwards compatible name for the BayesPy-backed model
+from .bayespy import GAM as BayesianGAM
@@ -0,0 +1,278 @@
+"""Unit tests for the BayesPy formula type"""
+
+
+import numpy as np
+from numpy.testing import (
+    assert_array_equal,
+    assert_almost_equal
+)
+import pytest
+
+from ronia import utils
+from ronia.formulae import bayespy as bpf
+
+
+def test_design_matrix():
+    input_data = np.array([0., 1., 2., 3.])
+    basis = [
+        lambda t: np.ones(len(t)),
+        lambda t: t,
+        lambda t: t ** 2
+    ]
+    X = bpf.design_matrix(input_data, basis)
+    assert_array_equal(
+        X,
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis])
+    )
+    return
+
+
+@pytest.mark.parametrize("Formula", [bpf.ReLU, bpf.FlippedReLU])
+def test_relu_batch_evaluation(Formula):
+    grid = np.arange(0., 6., 1.)
+    input_data = np.array([-0.5, 0.5, 2.0, 3.5, 7.0])
+    formula = Formula(grid)
+    [basis] = formula.bases
+    assert isinstance(basis, bpf.BatchedBasis)
+    assert len(basis) == len(grid) - 2
+    # Batched evaluation agrees with the per-function fallback
+    assert_array_equal(
+        bpf.design_matrix(input_data, basis),
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis])
+    )
+    return
+
+
+@pytest.mark.parametrize("order", [1, 2, 3])
+@pytest.mark.parametrize("extrapolate", [False, True])
+def test_bspline_batch_evaluation(order, extrapolate):
+    grid = np.arange(0., 5., 1.)
+    input_data = np.array([-1.5, -0.5, 0.0, 0.7, 2.2, 3.9, 4.0, 5.5])
+    formula = bpf.BSpline1d(grid, order=order, extrapolate=extrapolate)
+    [basis] = formula.bases
+    assert isinstance(basis, bpf.BatchedBasis)
+    assert len(basis) == len(grid) + order - 2
+    # Batched evaluation agrees with the per-element fallback
+    assert_almost_equal(
+        bpf.design_matrix(input_data, basis),
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis]),
+        decimal=10
+    )
+    return
+
+
+def test_exp_squared_eigh_cache():
+    grid = np.arange(-1., 1., 0.1)
+    bpf._exp_squared_svd.cache_clear()
+    formula_1 = bpf.ExpSquared1d(grid, corrlen=0.5, sigma=1.0)
+    formula_2 = bpf.ExpSquared1d(grid, corrlen=0.5, sigma=2.0)
+    assert bpf._exp_squared_svd.cache_info().hits == 1
+    # Cached-and-rescaled decomposition agrees with the direct one
+    input_data = np.arange(-1., 1., 0.25)
+    assert_almost_equal(
+        bpf.design_matrix(input_data, formula_2.bases[0]),
+        np.sqrt(2.0) * bpf.design_matrix(input_data, formula_1.bases[0]),
+        decimal=10
+    )
+    assert_almost_equal(
+        bpf.design_matrix(grid, formula_1.bases[0]),
+        utils.decompose_covariance(
+            utils.exp_squared(
+                x1=grid.reshape(-1, 1),
+                x2=grid.reshape(-1, 1),
+                corrlen=0.5,
+                sigma=1.0
+            ),
+            energy=0.99
+        ),
+        decimal=10
+    )
+    return
+
+
+def test_interp_basis_packed():
+    grid = np.arange(-1., 1., 0.1)
+    formula = bpf.ExpSquared1d(grid, corrlen=0.5, sigma=1.0)
+    [basis] = formula.bases
+    assert isinstance(basis, bpf.BatchedBasis)
+    # Packed interpolation agrees with the per-column interpolators,
+    # including extrapolation
+    input_data = np.array([-1.5, -0.3, 0.0, 0.55, 1.5])
+    assert_almost_equal(
+        bpf.design_matrix(input_data, basis),
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis]),
+        decimal=10
+    )
+    return
+
+
+def test_exp_squared_nystrom():
+    grid = np.arange(-1., 1., 0.05)
+    kernel = utils.exp_squared(
+        x1=grid.reshape(-1, 1),
+        x2=grid.reshape(-1, 1),
+        corrlen=0.5,
+        sigma=2.0
+    )
+    # All grid points as inducing points reproduces the kernel exactly
+    formula = bpf.ExpSquared1d(
+        grid, corrlen=0.5, sigma=2.0, energy=1.01, n_inducing=len(grid)
+    )
+    V = bpf.design_matrix(grid, formula.bases[0])
+    assert_almost_equal(V @ V.T, kernel, decimal=8)
+    # A coarse inducing set still approximates a smooth kernel well
+    formula = bpf.ExpSquared1d(
+        grid, corrlen=0.5, sigma=2.0, energy=1.01, n_inducing=10
+    )
+    V = bpf.design_matrix(grid, formula.bases[0])
+    assert V.shape[1] <= 10
+    assert np.max(np.abs(V @ V.T - kernel)) < 1e-3
+    return
+
+
+def test_isotropic_prior():
+    grid = np.arange(0., 6., 1.)
+    formula = bpf.ReLU(grid)
+    assert isinstance(formula.prior, utils.IsotropicPrior)
+    assert_array_equal(formula.prior[0], np.zeros(len(grid) - 2))
+    assert_array_equal(formula.prior[1], np.identity(len(grid) - 2))
+    # Concatenation fills the diagonal block without densifying first
+    concatenated = bpf.Scalar((1., 2.)) + formula
+    assert_array_equal(
+        concatenated.prior[1],
+        np.diag(np.hstack([2., np.ones(len(grid) - 2)]))
+    )
+    return
+
+
+def test_kron_prior():
+    np.random.seed(42)
+    (m, n) = (3, 4)
+    Lambda_a = np.random.rand(m, m)
+    Lambda_b = np.random.rand(n, n)
+    Lambda_a = Lambda_a @ Lambda_a.T + m * np.eye(m)
+    Lambda_b = Lambda_b @ Lambda_b.T + n * np.eye(n)
+    prior = bpf.KronPrior(
+        mu_a=np.arange(m),
+        mu_b=np.arange(n),
+        Lambda_a=Lambda_a,
+        Lambda_b=Lambda_b
+    )
+    dense = np.kron(Lambda_a, Lambda_b)
+    assert_array_equal(prior[0], np.kron(np.arange(m), np.arange(n)))
+    assert_array_equal(prior[1], dense)
+    v = np.random.rand(m * n)
+    assert_almost_equal(prior.matvec(v), dense @ v, decimal=10)
+    (chol_a, chol_b) = prior.cholesky()
+    assert_almost_equal(
+        np.kron(chol_a, chol_b),
+        np.linalg.cholesky(dense),
+        decimal=10
+    )
+    assert not prior.is_zero_mean
+    # Zero factor means skip the Kronecker product altogether
+    zero_prior = bpf.KronPrior(
+        mu_a=np.zeros(m),
+        mu_b=np.zeros(n),
+        Lambda_a=Lambda_a,
+        Lambda_b=Lambda_b
+    )
+    assert zero_prior.is_zero_mean
+    assert_array_equal(zero_prior.mean, np.zeros(m * n))
+    return
+
+
+def test_build_X():
+    input_data = np.array([0., 1., 2.])
+    formula = bpf.Scalar() + bpf.Line() + bpf.FlippedReLU(
+        np.arange(0., 4., 1.)
+    )
+    assert_array_equal(
+        formula.build_X(input_data),
+        np.hstack(formula.build_Xs(input_data))
+    )
+    return
+
+
+def test_kron_batch_evaluation():
+    input_data = np.array([0., 1., 2., 3.])
+    a = bpf.Flatten(bpf.Scalar() + bpf.Line())
+    b = bpf.Flatten(bpf.Line() + bpf.Function(lambda t: t ** 2, (0, 1)))
+    formula = bpf.Kron(a, b)
+    [basis] = formula.bases
+    assert isinstance(basis, bpf.BatchedBasis)
+    assert len(basis) == 4
+    assert_array_equal(
+        bpf.design_matrix(input_data, basis),
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis])
+    )
+    return
+
+
+def test_mul_batch_evaluation():
+    input_data = np.array([0., 1., 2., 3.])
+    formula = bpf.ReLU(np.arange(0., 6., 1.)) * (lambda t: t ** 2)
+    [basis] = formula.bases
+    assert isinstance(basis, bpf.BatchedBasis)
+    assert_array_equal(
+        bpf.design_matrix(input_data, basis),
+        np.hstack([f(input_data).reshape(-1, 1) for f in basis])
+    )
+    return
+
+
+def test_compile_X():
+    input_data = np.array([0., 1., 2.])
+    formula = bpf.Scalar() + bpf.Line() + bpf.ReLU(np.arange(0., 4., 1.))
+    build = formula.compile_X()
+    assert_array_equal(build(input_data), formula.build_X(input_data))
+    assert build(input_data, dtype=np.float32).dtype == np.float32
+    return
+
+
+def test_build_X_parallel(monkeypatch):
+    monkeypatch.setattr(bpf, "_PARALLEL_MIN_ROWS", 1)
+    input_data = np.arange(0., 10., 1.)
+    formula = bpf.Scalar() + bpf.Line() + bpf.ReLU(np.arange(0., 6., 1.))
+    assert_array_equal(
+        formula.build_X(input_data),
+        np.hstack(formula.build_Xs(input_data))
+    )
+    return
+
+
+def test_build_nodes():
+    input_data = np.array([0., 1., 2.])
+    formula = bpf.Scalar(prior=(1., 2.)) + bpf.Line(prior=(2., 2.))
+    (theta, F) = formula.build_nodes(input_data)
+    assert_almost_equal(
+        F.get_moments()[0],
+        formula.build_X(input_data) @ theta.get_moments()[0],
+        decimal=10
+    )
+    return
+
+
+def test_build_X_float32():
+    input_data = np.array([0., 1., 2.])
+    formula = bpf.Scalar() + bpf.Line() + bpf.FlippedReLU(
+        np.arange(0., 4., 1.)
+    )
+    X = formula.build_X(input_data, dtype=np.float32)
+    assert X.dtype == np.float32
+    assert_almost_equal(X, formula.build_X(input_data), decimal=6)
+    return
+
+
+def test_build_X_cache():
+    input_data = np.array([0., 1., 2.])
+    formula = bpf.Scalar() + bpf.Line()
+    X = formula.build_X(input_data)
+    # Equal contents hit the cache, also through a fresh array
+    assert formula.build_X(input_data) is X
+    assert formula.build_X(np.array([0., 1., 2.])) is X
+    assert formula.build_X(np.array([0., 1., 3.])) is not X
+    # A different formula does not share entries
+    other = bpf.Scalar() + bpf.Line()
+    assert other.build_X(input_data) is not X
+    return
@@ -6,7 +6,6 @@ import functools
 from typing import (Callable, Dict, Generator, Iterable, List, Tuple)
 
 import numpy as np
-import scipy as sp
 from scipy import interpolate
 
 
@@ -88,12 +87,34 @@ tuplefilter.__doc__ = """Filter for tuples with partial evaluation
 """
 
 
+def rlift_basis(basis: List[Callable], f: Callable) -> List[Callable]:
+    """Lift each basis function from right
+
+    """
+    return listmap(rlift(f))(basis)
+
+
 #
 # Iterables
 # ~~~~~~~~~
 #
 
 
+def flatten(x: list) -> list:
+    """Flatten a list of lists once
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        flatten([[1, 2], [3]])
+        # [1, 2, 3]
+
+    """
+    return sum(map(list, x), [])
+
+
 def unflatten(x: list, y: list) -> list:
     """Unflatten according to a reference
 
@@ -299,6 +320,25 @@ def decompose_covariance(H, energy: float=1.01) -> np.ndarray:
     return np.dot(U[:, crop], np.sqrt(np.diag(S[crop])))
 
 
+def interp1d_packed(v, grid, **kwargs) -> Callable:
+    """Single interpolator over all columns of an array
+
+    Packs the columns into one :class:`scipy.interpolate.interp1d`
+    object so that evaluating every "basis" vector shares one interval
+    search and coefficient lookup. The returned callable maps input
+    points to the full ``(N, K)`` array of column values.
+
+    Parameters
+    ----------
+    v : np.array
+        Each column is a "basis" vector
+    grid : np.ndarray
+        Interpolation grid
+
+    """
+    return interpolate.interp1d(grid, v, axis=0, **kwargs)
+
+
 def interp_arrays1d(v, grid, **kwargs) -> List:
     """Create list of interpolators from a given array
 
@@ -340,6 +380,44 @@ def write_to_hdf5(group, data, name):
 #
 
 
+class IsotropicPrior:
+    """Zero-mean Gaussian prior with precision ``scale * I``
+
+    Stands in for the tuple ``(np.zeros(size), scale * np.identity(size))``
+    without allocating the dense identity until a consumer indexes the
+    precision. :func:`concat_gaussians` recognizes the type and fills
+    only the diagonal of the corresponding block.
+
+    Parameters
+    ----------
+    size : int
+        Dimension of the Gaussian
+    scale : float
+        Value of the diagonal precision entries
+
+    """
+
+    def __init__(self, size: int, scale: float=1.0):
+        self.size = size
+        self.scale = scale
+        return
+
+    @property
+    def mean(self) -> np.ndarray:
+        return np.zeros(self.size)
+
+    @property
+    def precision(self) -> np.ndarray:
+        Lambda = np.zeros((self.size, self.size))
+        np.fill_diagonal(Lambda, self.scale)
+        return Lambda
+
+    def __getitem__(self, index):
+        # Quacks like the usual (mean, precision) tuple; one index
+        # materializes only the asked-for array
+        return self.mean if index == 0 else self.precision
+
+
 def concat_gaussians(gaussians):
     """Concatenate means and covariances to one Gaussian
 
@@ -349,10 +427,23 @@ def concat_gaussians(gaussians):
         List of mean-precision tuples of each Gaussian
 
     """
-    return (
-        np.hstack([g[0] for g in gaussians]),
-        sp.linalg.block_diag(*[g[1] for g in gaussians])
-    )
+    sizes = [
+        g.size if isinstance(g, IsotropicPrior)
+        else len(np.atleast_2d(g[1]))
+        for g in gaussians
+    ]
+    # Fill one preallocated matrix instead of letting block_diag
+    # concatenate through intermediate blocks
+    Lambda = np.zeros((sum(sizes), sum(sizes)))
+    i = 0
+    for (g, size) in zip(gaussians, sizes):
+        block = Lambda[i:i + size, i:i + size]
+        if isinstance(g, IsotropicPrior):
+            np.fill_diagonal(block, g.scale)
+        else:
+            block[...] = np.atleast_2d(g[1])
+        i += size
+    return (np.hstack([g[0] for g in gaussians]), Lambda)
 
 
 def solve_covariance(u) -> np.ndarray:
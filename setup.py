@@ -24,7 +24,8 @@ setup(
     license=about["__license__"],
     install_requires=[
         "numpy>=1.10.0",
-        "scipy>=0.13.0",
+        # BSpline.design_matrix appeared in SciPy 1.8
+        "scipy>=1.8.0",
         "bayespy",
         "h5py",
     ],